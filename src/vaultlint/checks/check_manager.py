@@ -4,7 +4,6 @@ import logging
 from typing import TYPE_CHECKING
 
 from vaultlint.checks.structure.struct_checker import struct_checker
-from vaultlint.output import output
 
 if TYPE_CHECKING:
     from vaultlint.cli import LintContext
@@ -21,12 +20,18 @@ def check_manager(context: "LintContext") -> bool:
     Returns:
         bool: True if all checks passed, False otherwise
     """
-    # Show progress with spinner
-    with output.show_progress("Running structure checks") as progress:
-        progress.add_task("Running structure checks", total=None)
-        
-        # Execute structure check with context
+    from vaultlint.output import output
+
+    if context.spec_path is None:
+        # Nothing to validate against - skip the spinner setup
         result = struct_checker(context)
+    else:
+        # Show progress with spinner
+        with output.show_progress("Running structure checks") as progress:
+            progress.add_task("Running structure checks", total=None)
+
+            # Execute structure check with context
+            result = struct_checker(context)
     
     # Print appropriate summary
     spec_name = context.spec_path.name if context.spec_path else None
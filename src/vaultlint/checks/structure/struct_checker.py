@@ -1,19 +1,47 @@
 """Example basic vault structure check."""
 
 from pathlib import Path
+import copy
+import functools
 import logging
 import yaml
 from typing import TYPE_CHECKING
 
+try:
+    from yaml import CSafeLoader as SpecLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as SpecLoader
+
 if TYPE_CHECKING:
     from vaultlint.cli import LintContext
 
 LOG = logging.getLogger("vaultlint.checks.structure_checker")
 
+# Number of parsed specification files kept in memory
+SPEC_CACHE_SIZE = 8
+
+
+@functools.lru_cache(maxsize=SPEC_CACHE_SIZE)
+def _load_spec_cached(path: Path, mtime_ns: int, size: int):
+    """Parse a YAML file, memoized on its path, modification time and size.
+
+    The stat fields are part of the cache key so an edited file is parsed
+    again (size also catches edits within a coarse mtime tick); stale
+    entries simply age out of the LRU cache.
+    """
+    # Passing the open file (not its bytes) keeps the filename in YAML errors
+    with path.open("rb") as f:
+        return yaml.load(f, Loader=SpecLoader)
 
-def load_spec_file(path: str):
+
+def load_spec_file(path: Path):
     """Load a YAML file and return its content as a dictionary.
 
+    Repeated loads of an unchanged file are served from an in-memory cache,
+    so several checks can share one specification without re-parsing it.
+    Each call returns its own deep copy, so a caller that modifies the
+    result cannot affect later loads.
+
     Args:
         path: Path to the YAML specification file
 
@@ -26,16 +54,11 @@ def load_spec_file(path: str):
         yaml.YAMLError: If the YAML content is invalid
         OSError/IOError: For other I/O related errors
     """
-    path = Path(path)
-
     try:
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {path}")
-
-        with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        st = path.stat()
+        data = _load_spec_cached(path, st.st_mtime_ns, st.st_size)
 
-        return data
+        return copy.deepcopy(data)
 
     except yaml.YAMLError as e:
         LOG.error("YAML error while processing specification file: %s", e)
@@ -65,7 +88,7 @@ def struct_checker(context: "LintContext") -> bool:
         return True  # Consider this a success if no spec is required
 
     try:
-        spec = load_spec_file(str(context.spec_path))
+        spec = load_spec_file(context.spec_path)
         # Keep only debug logging for development
         LOG.debug("Loaded specification from: %s", context.spec_path)
         LOG.debug("Spec content: %s", spec)
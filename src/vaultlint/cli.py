@@ -1,13 +1,15 @@
 """Command-line interface for vaultlint."""
 
 import os
+import re
+import stat
 import sys
 import logging
 import argparse
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 import importlib.metadata as im
-from .output import output
 
 # Exit codes
 EXIT_SUCCESS = 0
@@ -28,14 +30,16 @@ WINDOWS_MAX_SAFE_PATH_LENGTH = WINDOWS_MAX_PATH_LIMIT - WINDOWS_SAFE_PATH_BUFFER
 # Platform-specific access check constants
 WINDOWS_ACCESS_CHECK = os.R_OK
 UNIX_ACCESS_CHECK = os.R_OK | os.X_OK
-
-# Python version compatibility constants
-PYTHON_VERSION_WITH_IS_RELATIVE_TO = (3, 9)  # Path.is_relative_to() added in 3.9
+PLATFORM_ACCESS_CHECK = WINDOWS_ACCESS_CHECK if os.name == "nt" else UNIX_ACCESS_CHECK
 
 # Package version constants
 PACKAGE_NAME = "vaultlint"
 FALLBACK_VERSION = "0.0.0+local"
 
+# argparse error message patterns
+REQUIRED_ARGUMENTS_RE = re.compile(r"the following arguments are required: (.+)")
+UNRECOGNIZED_ARGUMENTS_RE = re.compile(r"unrecognized arguments: (.+)")
+
 
 LOG = logging.getLogger("vaultlint.cli")
 
@@ -43,33 +47,90 @@ LOG = logging.getLogger("vaultlint.cli")
 class RichArgumentParser(argparse.ArgumentParser):
     """Custom ArgumentParser that uses rich formatting for error messages."""
 
-    def __init__(self, *args, output_manager, **kwargs):
-        """Initialize with explicit output manager dependency injection."""
+    def __init__(self, *args, output_manager=None, **kwargs):
+        """Initialize with an optional output manager dependency injection.
+
+        When no output manager is given, the shared one is imported on the
+        first error so that --help and --version never load Rich.
+        """
         super().__init__(*args, **kwargs)
         self._output_manager = output_manager
 
     def error(self, message: str) -> None:
         """Override error method to use rich formatting."""
         # Transform the message to be more user-friendly
-        if "required:" in message:
-            if "path" in message:
+        if match := REQUIRED_ARGUMENTS_RE.match(message):
+            if "path" in match[1]:
                 friendly_message = "Missing required argument 'path'"
             else:
-                friendly_message = message.replace(
-                    "the following arguments are required: ",
-                    "Missing required argument: ",
-                )
-        elif "unrecognized arguments:" in message:
-            args = message.replace("unrecognized arguments: ", "")
-            friendly_message = f"Unrecognized argument: {args}"
+                friendly_message = f"Missing required argument: {match[1]}"
+        elif match := UNRECOGNIZED_ARGUMENTS_RE.match(message):
+            friendly_message = f"Unrecognized argument: {match[1]}"
         else:
             friendly_message = message.capitalize()
 
-        self._output_manager.print_usage_error(self.prog, friendly_message)
+        output_manager = self._output_manager
+        if output_manager is None:
+            from .output import output as output_manager
+
+        output_manager.print_usage_error(self.prog, friendly_message)
         self.exit(EXIT_USAGE_ERROR)
 
 
-@dataclass(frozen=True)
+class LazyVersionAction(argparse.Action):
+    """Version action that looks up the package version only when invoked."""
+
+    def __init__(
+        self,
+        option_strings,
+        dest=argparse.SUPPRESS,
+        default=argparse.SUPPRESS,
+        help="show program's version number and exit",
+    ):
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=default,
+            nargs=0,
+            help=help,
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        """Print '<prog> <version>' and exit, like argparse's version action."""
+        sys.stdout.write(f"{parser.prog} {_get_package_version()}\n")
+        parser.exit()
+
+
+class _DeferredStreamHandler(logging.Handler):
+    """Stderr handler that builds its StreamHandler and Formatter on first use.
+
+    Most runs never log at WARNING or above, so the real handler is usually
+    never needed.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._handler = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Create the underlying handler if needed and forward the record.
+
+        Failures while building the handler are reported through
+        handleError(), like StreamHandler.emit(), instead of escaping from
+        the logging call that triggered them.
+        """
+        if self._handler is None:
+            try:
+                handler = logging.StreamHandler()
+                handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+            except Exception:
+                self.handleError(record)
+                return
+            self._handler = handler
+        self._handler.emit(record)
+
+
+@dataclass(frozen=True, slots=True)
 class LintContext:
     """Context object containing all configuration for linting operations."""
 
@@ -77,20 +138,24 @@ class LintContext:
     spec_path: Path | None = None
 
 
-def _get_platform_access_check() -> int:
-    """Get the appropriate os.access() flags for the current platform."""
-    return WINDOWS_ACCESS_CHECK if os.name == "nt" else UNIX_ACCESS_CHECK
+@functools.cache
+def _get_package_version() -> str:
+    """Return the installed package version, or a fallback for source checkouts."""
+    try:
+        return im.version(PACKAGE_NAME)
+    except im.PackageNotFoundError:
+        return FALLBACK_VERSION
 
 
-def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
-    """Parse and return command-line arguments."""
+@functools.cache
+def _build_parser() -> RichArgumentParser:
+    """Build the argument parser once per process."""
     parser = RichArgumentParser(
         prog="vaultlint",
         description=(
             "A modular linter for Obsidian that validates Markdown, "
             "YAML front matter, and vault structure"
         ),
-        output_manager=output,
     )
     parser.add_argument(
         "path",
@@ -103,13 +168,7 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
         type=Path,
         help="Path to vault specification file (default: look for vspec.yaml in vault root)",
     )
-    try:
-        pkg_version = im.version(PACKAGE_NAME)
-    except im.PackageNotFoundError:
-        pkg_version = FALLBACK_VERSION
-    parser.add_argument(
-        "-V", "--version", action="version", version=f"%(prog)s {pkg_version}"
-    )
+    parser.add_argument("-V", "--version", action=LazyVersionAction)
     parser.add_argument(
         "-v",
         "--verbose",
@@ -117,7 +176,47 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
         default=0,
         help="Increase verbosity (use -vv for debug)",
     )
-    return parser.parse_args(argv)
+    return parser
+
+
+def _fast_parse(argv: list[str]) -> argparse.Namespace | None:
+    """Parse the common invocations without building the argparse parser.
+
+    Only handles a single vault path plus -s/--spec and -v/--verbose flags.
+    Returns None for anything else (help, version, errors, abbreviations...)
+    so the full parser can handle it with its usual messages.
+    """
+    path = None
+    spec = None
+    verbose = 0
+    tokens = iter(argv)
+    for token in tokens:
+        if token in ("-s", "--spec"):
+            value = next(tokens, None)
+            if value is None or value.startswith("-"):
+                return None
+            spec = Path(value)
+        elif token == "--verbose":
+            verbose += 1
+        elif token[:1] == "-" and set(token[1:]) == {"v"}:
+            verbose += len(token) - 1
+        elif token.startswith("-") or path is not None:
+            return None
+        else:
+            path = Path(token)
+    if path is None:
+        return None
+    return argparse.Namespace(path=path, spec=spec, verbose=verbose)
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse and return command-line arguments."""
+    if argv is None:
+        argv = sys.argv[1:]
+    args = _fast_parse(argv)
+    if args is None:
+        args = _build_parser().parse_args(argv)
+    return args
 
 
 def _configure_logging(verbosity: int) -> None:
@@ -139,15 +238,11 @@ def _configure_logging(verbosity: int) -> None:
     # If running as a standalone CLI (no handlers configured), attach a simple handler
     root = logging.getLogger()
     if not root.handlers and not pkg_logger.handlers and not mod_logger.handlers:
-        try:
-            handler = logging.StreamHandler()
-            handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
-            pkg_logger.addHandler(handler)
-            # Prevent duplicate emission if a root handler is configured later.
-            pkg_logger.propagate = False
-        except (IOError, LookupError) as exc:
-            sys.stderr.write(f"Failed to configure logging: {exc}\n")
-            sys.exit(EXIT_VALIDATION_ERROR)
+        # The stream itself is only opened on the first record; see
+        # _DeferredStreamHandler.emit() for how failures there are handled.
+        pkg_logger.addHandler(_DeferredStreamHandler())
+        # Prevent duplicate emission if a root handler is configured later.
+        pkg_logger.propagate = False
 
 
 def _resolve_path_safely(path: Path, *, use_warnings: bool = False) -> Path | None:
@@ -158,21 +253,36 @@ def _resolve_path_safely(path: Path, *, use_warnings: bool = False) -> Path | No
         use_warnings: If True, print warnings instead of errors (for non-critical paths)
 
     Returns:
-        Resolved Path, or None if resolution failed
+        Absolute path, canonicalized only when relative, containing '..',
+        or a symlink; None if resolution failed. Symlinked parent
+        directories of an otherwise plain absolute path are left as-is.
     """
+    from .output import output
+
+    report = output.print_warning if use_warnings else output.print_error
+
     try:
-        # First do basic path expansion
-        expanded = path.expanduser()
+        # First do basic path expansion (only '~'-prefixed paths need it)
+        expanded = path.expanduser() if os.fspath(path).startswith("~") else path
 
         # Check path length (Windows MAX_PATH is 260, but we'll use a safe limit)
         if os.name == "nt" and len(str(expanded)) > WINDOWS_MAX_SAFE_PATH_LENGTH:
-            message = "Path exceeds maximum safe length"
-            if use_warnings:
-                output.print_warning(message, str(path))
-            else:
-                output.print_error(message, str(path))
+            report("Path exceeds maximum safe length", str(path))
             return None
 
+        # A single lstat() rejects missing paths before resolve() walks every
+        # component, and tells us whether the path itself is a symlink
+        mode = expanded.lstat().st_mode
+
+        # Fast path: an absolute path without '..' that is not itself a symlink
+        # can be used as-is, skipping resolve()'s per-component lstat walk
+        if (
+            expanded.is_absolute()
+            and ".." not in expanded.parts
+            and not stat.S_ISLNK(mode)
+        ):
+            return expanded
+
         # Resolve the path
         return expanded.resolve(strict=True)
 
@@ -182,10 +292,7 @@ def _resolve_path_safely(path: Path, *, use_warnings: bool = False) -> Path | No
             if not use_warnings
             else "Specification file not found"
         )
-        if use_warnings:
-            output.print_warning(message, str(path))
-        else:
-            output.print_error(message, str(path))
+        report(message, str(path))
         return None
     except (OSError, ValueError) as exc:
         message = (
@@ -193,37 +300,41 @@ def _resolve_path_safely(path: Path, *, use_warnings: bool = False) -> Path | No
             if not use_warnings
             else f"Could not resolve specification file: {exc}"
         )
-        if use_warnings:
-            output.print_warning(message, str(path))
-        else:
-            output.print_error(message, str(path))
+        report(message, str(path))
         return None
 
 
-def validate_vault_path(path: Path) -> bool:
+def validate_vault_path(path: Path) -> Path | None:
     """Validate that the given path exists, is a directory, and is readable.
 
     Performs basic security checks including path length validation.
+
+    Returns:
+        The vault's absolute path (see _resolve_path_safely for when it is
+        canonicalized), or None if validation failed
     """
+    from .output import output
+
     resolved = _resolve_path_safely(path)
     if resolved is None:
-        return False
+        return None
 
-    if not resolved.is_dir():
-        output.print_error("The path is not a directory", str(resolved))
-        return False
+    # A single scandir() both checks the path is a directory and probes readability
     try:
-        next(resolved.iterdir(), None)
+        with os.scandir(resolved) as entries:
+            next(entries, None)
+    except NotADirectoryError:
+        output.print_error("The path is not a directory", str(resolved))
+        return None
     except PermissionError:
         output.print_error("The directory is not readable", str(resolved))
-        return False
+        return None
     except OSError as exc:
         output.print_error(f"Could not access directory: {exc}", str(resolved))
-        return False
-    access_check = _get_platform_access_check()
-    if not os.access(resolved, access_check):
+        return None
+    if not os.access(resolved, PLATFORM_ACCESS_CHECK):
         output.print_warning("Directory may not be fully accessible", str(resolved))
-    return True
+    return resolved
 
 
 def resolve_spec_file(vault_path: Path, spec_arg: Path | None = None) -> Path | None:
@@ -247,38 +358,40 @@ def resolve_spec_file(vault_path: Path, spec_arg: Path | None = None) -> Path |
         return resolved_spec  # Returns None with warning if failed
 
     # Second priority: vspec.yaml in vault root
+    # vault_path is already resolved, so joining keeps the path absolute
     default_spec = vault_path / "vspec.yaml"
-    if default_spec.exists():
-        return default_spec.resolve()
-
-    # No spec file found - this is completely normal, not even a warning
-    return None
+    try:
+        os.stat(default_spec)
+    except OSError:
+        # No spec file found - this is completely normal, not even a warning
+        return None
+    return default_spec
 
 
 def run(vault_path: Path, spec_path: Path | None = None) -> int:
     """Core runner: validate path and dispatch linter."""
+    from .output import output
+
     # Start timing
     output.start_timing()
 
-    if not validate_vault_path(vault_path):
-        return EXIT_VALIDATION_ERROR
+    # Emit the run preamble (and any path warnings) in a single write
+    with output.batch():
+        resolved_vault = validate_vault_path(vault_path)
+        if resolved_vault is None:
+            return EXIT_VALIDATION_ERROR
 
-    # Use _resolve_path_safely instead of duplicating logic
-    resolved_vault = _resolve_path_safely(vault_path)
-    if resolved_vault is None:
-        return EXIT_VALIDATION_ERROR
+        # Print vault being checked with nice formatting
+        output.print_checking_vault(str(resolved_vault))
 
-    # Print vault being checked with nice formatting
-    output.print_checking_vault(str(resolved_vault))
+        # Resolve spec file path
+        resolved_spec = resolve_spec_file(resolved_vault, spec_path)
 
-    # Resolve spec file path
-    resolved_spec = resolve_spec_file(resolved_vault, spec_path)
-
-    # Print spec status with nice formatting
-    if resolved_spec:
-        output.print_using_spec(resolved_spec.name)
-    else:
-        output.print_no_spec()
+        # Print spec status with nice formatting
+        if resolved_spec:
+            output.print_using_spec(resolved_spec.name)
+        else:
+            output.print_no_spec()
 
     # Create context object with all configuration
     context = LintContext(vault_path=resolved_vault, spec_path=resolved_spec)
@@ -298,6 +411,8 @@ def main(argv: list[str] | None = None) -> int:
     try:
         return run(args.path, args.spec)
     except KeyboardInterrupt:
+        from .output import output
+
         output.print_error("Operation interrupted by user")
         return EXIT_KEYBOARD_INTERRUPT
 
@@ -4,9 +4,11 @@ Minimal, clean, and consistent styling.
 """
 
 import time
+from contextlib import contextmanager
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.text import Text
 
 # Global console instance
 console = Console()
@@ -17,6 +19,10 @@ class OutputManager:
 
     def __init__(self):
         self.start_time = None
+        self._buffer = None  # Pending lines while inside batch()
+        # Markup parsed once up front; messages are appended as plain text
+        self._success_prefix = Text.from_markup("[green]✓[/green] ")
+        self._no_spec = Text("Using default checks (no specification file)")
 
     def start_timing(self):
         """Start timing for operations."""
@@ -28,37 +34,65 @@ class OutputManager:
             return 0.0
         return time.time() - self.start_time
 
+    def _emit(self, text: Text):
+        """Print a line of text, or queue it while batching."""
+        if self._buffer is not None:
+            self._buffer.append(text)
+        else:
+            console.print(text)
+
+    def flush(self):
+        """Print all queued lines with a single console write."""
+        if self._buffer:
+            console.print(Text("\n").join(self._buffer))
+            self._buffer.clear()
+
+    @contextmanager
+    def batch(self):
+        """Queue messages printed inside the block and flush them once at the end."""
+        if self._buffer is not None:
+            # Nested batch: the outermost one flushes
+            yield
+            return
+        self._buffer = []
+        try:
+            yield
+        finally:
+            self.flush()
+            self._buffer = None
+
     def print_checking_vault(self, vault_path: str):
         """Print vault checking message with Obsidian purple color."""
-        console.print(f"Checking vault: [bold magenta]{vault_path}[/bold magenta]")
+        self._emit(Text.assemble("Checking vault: ", (vault_path, "bold magenta")))
 
     def print_using_spec(self, spec_name: str):
         """Print specification being used."""
-        console.print(f"Using specification: [bold]{spec_name}[/bold]")
+        self._emit(Text.assemble("Using specification: ", (spec_name, "bold")))
 
     def print_no_spec(self):
         """Print message when no specification file found."""
-        console.print("Using default checks (no specification file)")
+        self._emit(self._no_spec.copy())
 
     def print_success(self, message: str):
         """Print success message with green checkmark."""
-        console.print(f"[green]✓[/green] {message}")
+        self._emit(self._success_prefix + message)
 
     def print_error(self, message: str, path: str = None):
         """Print error message with red X."""
-        if path:
-            console.print(f"[red]✗ {message} '[bold red]{path}[/bold red]'[/red]")
-        else:
-            console.print(f"[red]✗ {message}[/red]")
+        self._emit(self._styled_message("✗", message, path, "red"))
 
     def print_warning(self, message: str, path: str = None):
         """Print warning message with yellow warning triangle."""
+        self._emit(self._styled_message("⚠", message, path, "yellow"))
+
+    @staticmethod
+    def _styled_message(icon: str, message: str, path: str | None, color: str) -> Text:
+        """Build an icon-prefixed message, with the optional path in bold."""
         if path:
-            console.print(
-                f"[yellow]⚠ {message} '[bold yellow]{path}[/bold yellow]'[/yellow]"
+            return Text.assemble(
+                f"{icon} {message} '", (path, f"bold {color}"), "'", style=color
             )
-        else:
-            console.print(f"[yellow]⚠ {message}[/yellow]")
+        return Text(f"{icon} {message}", style=color)
 
     def print_usage_error(self, prog: str, message: str):
         """Print argument parsing error with rich formatting."""
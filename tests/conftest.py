@@ -0,0 +1,71 @@
+"""Shared pytest fixtures for vaultlint tests."""
+
+import io
+import logging
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+from vaultlint import output as output_module
+
+
+@pytest.fixture(scope="session")
+def valid_vault(tmp_path_factory):
+    """Return a minimal valid vault directory (contains .obsidian).
+
+    The directory is shared by the whole session, so tests must treat it
+    as read-only; tests that write into a vault should build their own
+    under tmp_path.
+    """
+    vault = tmp_path_factory.mktemp("vault")
+    (vault / ".obsidian").mkdir()
+    return vault
+
+
+@pytest.fixture
+def plain_output(monkeypatch):
+    """Route Rich output to an in-memory, uncolored, wide console.
+
+    Returns the StringIO sink; read it with getvalue(). Avoids pytest's
+    stdout capture and Rich's terminal-dependent wrapping and styling.
+    """
+    sink = io.StringIO()
+    monkeypatch.setattr(
+        output_module,
+        "console",
+        Console(file=sink, no_color=True, width=200, highlight=False),
+    )
+    return sink
+
+
+@pytest.fixture
+def fake_home(tmp_path, monkeypatch):
+    """Make '~' expand to a fresh tmp_path/homeuser directory and return it."""
+    home = tmp_path / "homeuser"
+    home.mkdir()
+    original_expanduser = Path.expanduser
+
+    def fake_expanduser(self: Path):
+        if str(self).startswith("~"):
+            return Path(str(self).replace("~", str(home), 1))
+        return original_expanduser(self)
+
+    monkeypatch.setattr(Path, "expanduser", fake_expanduser)
+    return home
+
+
+@pytest.fixture(autouse=True)
+def restore_vaultlint_loggers():
+    """Undo the logger changes main() makes, so they do not leak between tests.
+
+    _configure_logging() sets levels on the 'vaultlint' and 'vaultlint.cli'
+    loggers and may attach a handler and turn off propagation.
+    """
+    loggers = [logging.getLogger("vaultlint"), logging.getLogger("vaultlint.cli")]
+    saved = [(lg, lg.level, lg.handlers[:], lg.propagate) for lg in loggers]
+    yield
+    for lg, level, handlers, propagate in saved:
+        lg.setLevel(level)
+        lg.handlers[:] = handlers
+        lg.propagate = propagate
@@ -1,67 +1,62 @@
 """Tests for check manager orchestration functionality."""
 
 import logging
+from dataclasses import dataclass, field
 from pathlib import Path
 import pytest
 
 from vaultlint.cli import LintContext
+from vaultlint.checks import check_manager as check_manager_module
 from vaultlint.checks.check_manager import check_manager
+from vaultlint.output import output
 
 
-# ---------- Core orchestration behavior ----------
+@dataclass
+class StructCheckerSpy:
+    """Stand-in for struct_checker that records every context it receives."""
 
+    return_value: bool = True
+    calls: list = field(default_factory=list)
 
-def test_check_manager_propagates_struct_checker_success(monkeypatch, capsys):
-    """Test check_manager returns True when struct_checker succeeds."""
-    # Mock struct_checker to return success
-    def mock_struct_checker(context):
-        return True
+    def __call__(self, context):
+        self.calls.append(context)
+        return self.return_value
 
-    monkeypatch.setattr(
-        "vaultlint.checks.check_manager.struct_checker", mock_struct_checker
-    )
 
-    context = LintContext(vault_path=Path("/vault"))
-    result = check_manager(context)
+@pytest.fixture
+def struct_checker_spy(monkeypatch):
+    """Replace struct_checker inside check_manager with a recording spy."""
+    spy = StructCheckerSpy()
+    monkeypatch.setattr(check_manager_module, "struct_checker", spy)
+    return spy
 
-    assert result is True
-    # Verify Rich output shows success summary
-    captured = capsys.readouterr()
-    assert "Vault validation completed successfully" in captured.out
 
+# ---------- Core orchestration behavior ----------
 
-def test_check_manager_propagates_struct_checker_failure(monkeypatch, capsys):
-    """Test check_manager returns False when struct_checker fails."""
-    # Mock struct_checker to return failure
-    def mock_struct_checker(context):
-        return False
 
-    monkeypatch.setattr(
-        "vaultlint.checks.check_manager.struct_checker", mock_struct_checker
-    )
+@pytest.mark.parametrize(
+    "checker_result, summary",
+    [
+        (True, "Vault validation completed successfully"),
+        (False, "Vault validation failed"),
+    ],
+)
+def test_check_manager_propagates_struct_checker_result(
+    struct_checker_spy, plain_output, checker_result, summary
+):
+    """Test check_manager returns struct_checker's result and shows the summary."""
+    struct_checker_spy.return_value = checker_result
 
     context = LintContext(vault_path=Path("/vault"))
     result = check_manager(context)
 
-    assert result is False
-    # Verify Rich output shows failure summary
-    captured = capsys.readouterr()
-    assert "Vault validation failed" in captured.out
+    assert result is checker_result
+    # Verify Rich output shows the matching summary
+    assert summary in plain_output.getvalue()
 
 
-def test_check_manager_passes_context_to_struct_checker(monkeypatch):
+def test_check_manager_passes_context_to_struct_checker(struct_checker_spy):
     """Test check_manager correctly passes LintContext to struct_checker."""
-    received_context = None
-
-    def mock_struct_checker(context):
-        nonlocal received_context
-        received_context = context
-        return True
-
-    monkeypatch.setattr(
-        "vaultlint.checks.check_manager.struct_checker", mock_struct_checker
-    )
-
     vault_path = Path("/test/vault")
     spec_path = Path("/test/spec.yaml")
     context = LintContext(vault_path=vault_path, spec_path=spec_path)
@@ -69,9 +64,20 @@ def test_check_manager_passes_context_to_struct_checker(monkeypatch):
     check_manager(context)
 
     # Verify the exact same context object was passed
-    assert received_context is context
-    assert received_context.vault_path == vault_path
-    assert received_context.spec_path == spec_path
+    assert len(struct_checker_spy.calls) == 1
+    assert struct_checker_spy.calls[0] is context
+
+
+def test_check_manager_skips_progress_without_spec(struct_checker_spy, monkeypatch):
+    """Test check_manager does not start the spinner when no spec is configured."""
+    def fail_show_progress(description):
+        raise AssertionError("show_progress should not be called")
+
+    monkeypatch.setattr(output, "show_progress", fail_show_progress)
+
+    context = LintContext(vault_path=Path("/vault"))
+
+    assert check_manager(context) is True
 
 
 # ---------- Error handling and robustness ----------
@@ -84,7 +90,8 @@ def test_check_manager_propagates_exceptions_from_struct_checker(monkeypatch):
         raise RuntimeError("Simulated struct_checker failure")
 
     monkeypatch.setattr(
-        "vaultlint.checks.check_manager.struct_checker",
+        check_manager_module,
+        "struct_checker",
         mock_struct_checker_with_exception,
     )
 
@@ -98,41 +105,22 @@ def test_check_manager_propagates_exceptions_from_struct_checker(monkeypatch):
 # ---------- Logging behavior ----------
 
 
-def test_check_manager_shows_vault_path_in_summary(monkeypatch, capsys):
+def test_check_manager_shows_vault_path_in_summary(struct_checker_spy, plain_output):
     """Test check_manager shows the vault path in the summary."""
-    def mock_struct_checker(context):
-        return True
-
-    monkeypatch.setattr(
-        "vaultlint.checks.check_manager.struct_checker", mock_struct_checker
-    )
-
     vault_path = Path("/specific/vault/path")
     context = LintContext(vault_path=vault_path)
 
     check_manager(context)
 
     # Should show the specific vault path in Rich output
-    captured = capsys.readouterr()
-    assert str(vault_path) in captured.out
+    assert str(vault_path) in plain_output.getvalue()
 
 
 # ---------- Future-proofing and extensibility ----------
 
 
-def test_check_manager_is_stateless(monkeypatch):
+def test_check_manager_is_stateless(struct_checker_spy):
     """Test check_manager is stateless and can be called multiple times safely."""
-    call_count = 0
-
-    def mock_struct_checker(context):
-        nonlocal call_count
-        call_count += 1
-        return True
-
-    monkeypatch.setattr(
-        "vaultlint.checks.check_manager.struct_checker", mock_struct_checker
-    )
-
     context1 = LintContext(vault_path=Path("/vault1"))
     context2 = LintContext(vault_path=Path("/vault2"))
 
@@ -141,4 +129,5 @@ def test_check_manager_is_stateless(monkeypatch):
 
     assert result1 is True
     assert result2 is True
-    assert call_count == 2  # Each call should invoke struct_checker independently
+    # Each call should invoke struct_checker independently
+    assert struct_checker_spy.calls == [context1, context2]
@@ -1,9 +1,43 @@
 """Tests for CLI argument parsing functionality."""
 
+import importlib.metadata as im
+from importlib.metadata import PackageNotFoundError
+
 import pytest
 from pathlib import Path
 
-from vaultlint.cli import parse_arguments
+from vaultlint.cli import (
+    parse_arguments,
+    _build_parser,
+    _fast_parse,
+    _get_package_version,
+)
+
+
+@pytest.fixture
+def fresh_version_cache():
+    """Clear the memoized package version around tests that fake metadata."""
+    _get_package_version.cache_clear()
+    yield
+    _get_package_version.cache_clear()
+
+
+@pytest.fixture
+def mock_version(monkeypatch, fresh_version_cache):
+    """Return a setter that fakes importlib.metadata.version().
+
+    Pass a version string, or an exception class for version() to raise.
+    """
+
+    def set_version(value):
+        def fake_version(_name):
+            if isinstance(value, type) and issubclass(value, Exception):
+                raise value
+            return value
+
+        monkeypatch.setattr(im, "version", fake_version)
+
+    return set_version
 
 
 # ---------- Argument parsing ----------
@@ -42,37 +76,23 @@ def test_parse_arguments_spec_flag_optional():
     assert ns.spec is None
 
 
-def test_parse_arguments_version_flag_prints_version_and_exits(monkeypatch, capsys):
-    # Mock version() to ensure deterministic output
-    import importlib.metadata as im
+@pytest.mark.parametrize(
+    "metadata_version, expected",
+    [
+        ("1.2.3", "vaultlint 1.2.3\n"),
+        (PackageNotFoundError, "vaultlint 0.0.0+local\n"),
+    ],
+)
+def test_parse_arguments_version_flag_prints_version_and_exits(
+    mock_version, capsys, metadata_version, expected
+):
+    """Test -V prints '<prog> <version>' (or the fallback) and exits with 0."""
+    mock_version(metadata_version)
 
-    monkeypatch.setattr(im, "version", lambda _: "1.2.3")
     with pytest.raises(SystemExit) as exc:
         parse_arguments(["-V"])
     assert exc.value.code == 0
-    out = capsys.readouterr().out
-    # argparse "version" action prints "<prog> <version>"
-    assert "vaultlint 1.2.3" in out
-
-
-def test_parse_arguments_version_flag_without_package(monkeypatch, capsys):
-    import importlib.metadata as im
-    from importlib.metadata import PackageNotFoundError
-
-    def raise_not_found(_):
-        raise PackageNotFoundError
-
-    monkeypatch.setattr(im, "version", raise_not_found)
-
-    # argparse's "version" action exits with code 0 after printing fallback
-    with pytest.raises(SystemExit) as exc:
-        parse_arguments(["-V"])
-    assert exc.value.code == 0
-
-    out = capsys.readouterr().out
-    # format is "<prog> <version>\n"
-    assert out.startswith("vaultlint ")
-    assert "0.0.0+local" in out
+    assert capsys.readouterr().out == expected
 
 
 def test_parse_arguments_required_argument_missing_value():
@@ -91,3 +111,78 @@ def test_parse_arguments_required_argument_missing_value():
     with pytest.raises(SystemExit) as exc_info:
         parse_arguments(["/some/path", "--spec"])
     assert exc_info.value.code == 2
+
+
+def test_parser_skips_version_lookup_without_flag(monkeypatch, fresh_version_cache):
+    """Test that building and using the parser only looks up the version for -V."""
+    def fail_version(_):
+        raise AssertionError("version() should not be called")
+
+    monkeypatch.setattr(im, "version", fail_version)
+    # Build the parser while version() is failing, bypassing the fast path
+    _build_parser.cache_clear()
+    ns = _build_parser().parse_args(["/some/path"])
+    assert ns.path == Path("/some/path")
+
+
+def test_parser_is_reused_between_calls_without_leaking_state():
+    """Test that repeated parses share one parser without leaking state."""
+    assert _build_parser() is _build_parser()
+
+    first = _build_parser().parse_args(["/some/path", "-v", "-s", "/spec/file.yaml"])
+    second = _build_parser().parse_args(["/other/path"])
+
+    assert first.verbose == 1
+    assert first.spec == Path("/spec/file.yaml")
+    assert second.verbose == 0
+    assert second.spec is None
+    assert second.path == Path("/other/path")
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["/vault"],
+        ["/vault", "-v"],
+        ["-vv", "/vault"],
+        ["/vault", "--verbose", "-v"],
+        ["/vault", "-s", "/spec.yaml"],
+        ["--spec", "/a.yaml", "/vault", "-s", "/b.yaml"],
+    ],
+)
+def test_fast_parse_matches_argparse(argv):
+    """Test the fast path yields the same namespace as the full parser."""
+    assert _fast_parse(argv) == _build_parser().parse_args(argv)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [],
+        ["-h"],
+        ["-V"],
+        ["/vault", "-s"],
+        ["/vault", "--spec=/x"],
+        ["/a", "/b"],
+        ["/vault", "v-"],
+        ["v-", "/vault"],
+    ],
+)
+def test_fast_parse_defers_to_argparse(argv):
+    """Test the fast path gives up on anything but the common invocations."""
+    assert _fast_parse(argv) is None
+
+
+def test_package_version_is_looked_up_once(monkeypatch, fresh_version_cache):
+    """Test that the package metadata is only queried once per process."""
+    calls = []
+
+    def fake_version(name):
+        calls.append(name)
+        return "1.2.3"
+
+    monkeypatch.setattr(im, "version", fake_version)
+
+    assert _get_package_version() == "1.2.3"
+    assert _get_package_version() == "1.2.3"
+    assert calls == ["vaultlint"]
@@ -90,6 +90,13 @@ def test_lint_context_hashable():
     assert context_dict[context2] == "test_value"  # Same context should work as key
 
 
+def test_lint_context_uses_slots():
+    """Test that LintContext instances carry no per-instance __dict__."""
+    context = LintContext(vault_path=Path("/vault"))
+
+    assert not hasattr(context, "__dict__")
+
+
 # ---------- Path handling ----------
 
 
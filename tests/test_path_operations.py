@@ -22,94 +22,119 @@ def test_resolve_path_safely_existing_path(tmp_path):
     assert result.exists()
 
 
-def test_resolve_path_safely_nonexistent_path(capsys):
+def test_resolve_path_safely_nonexistent_path(plain_output):
     """Test _resolve_path_safely with non-existent path."""
     nonexistent = Path("/definitely/does/not/exist")
     result = _resolve_path_safely(nonexistent)
     assert result is None
     # Check Rich error output instead of logs
-    captured = capsys.readouterr()
-    assert "does not exist" in captured.out
+    assert "does not exist" in plain_output.getvalue()
 
 
-def test_resolve_path_safely_expanduser(tmp_path, monkeypatch):
+def test_resolve_path_safely_expanduser(fake_home):
     """Test _resolve_path_safely expands user home."""
-    # Create a test file in tmp_path to make it exist
-    test_file = tmp_path / "test_file.txt"
-    test_file.write_text("test")
+    result = _resolve_path_safely(Path("~"))
+    assert result is not None
+    assert result == fake_home.resolve()
 
-    # Mock expanduser to return our tmp_path when called with "~"
-    original_expanduser = Path.expanduser
 
-    def fake_expanduser(self):
-        if str(self) == "~":
-            return tmp_path
-        return original_expanduser(self)
+def test_resolve_path_safely_follows_symlink(tmp_path):
+    """Test _resolve_path_safely still canonicalizes symlinked paths."""
+    target = tmp_path / "target"
+    target.mkdir()
+    link = tmp_path / "link"
+    try:
+        link.symlink_to(target)
+    except OSError:
+        pytest.skip("Symlink creation not supported")
 
-    monkeypatch.setattr(Path, "expanduser", fake_expanduser)
+    assert _resolve_path_safely(link) == target.resolve()
 
-    result = _resolve_path_safely(Path("~"))
-    assert result is not None
-    assert result == tmp_path.resolve()
+
+def test_resolve_path_safely_keeps_symlinked_parent(tmp_path):
+    """Test an absolute path whose parent is a symlink is returned unresolved.
+
+    Only the final component is checked for a symlink; canonicalizing every
+    parent would cost the resolve() walk the fast path exists to skip.
+    """
+    real = tmp_path / "real"
+    (real / "vault").mkdir(parents=True)
+    link = tmp_path / "link"
+    try:
+        link.symlink_to(real)
+    except OSError:
+        pytest.skip("Symlink creation not supported")
+
+    result = _resolve_path_safely(link / "vault")
+    assert result == link / "vault"
+    assert result.resolve() == (real / "vault").resolve()
+
+
+def test_resolve_path_safely_collapses_parent_references(tmp_path):
+    """Test _resolve_path_safely removes '..' components from absolute paths."""
+    subdir = tmp_path / "subdir"
+    subdir.mkdir()
+
+    result = _resolve_path_safely(subdir / ".." / "subdir")
+    assert result == subdir.resolve()
+    assert ".." not in result.parts
 
 
 # ---------- Vault path validation ----------
 
 
-def test_validate_vault_path_ok(tmp_path, capsys):
-    """Test basic validation of a valid path."""
+def test_validate_vault_path_ok(tmp_path, plain_output):
+    """Test basic validation of a valid path returns the resolved path."""
     ok = validate_vault_path(tmp_path)
-    assert ok is True
+    assert ok == tmp_path.resolve()
     # Valid path should not produce error output
-    captured = capsys.readouterr()
-    assert "Error" not in captured.out
+    assert "Error" not in plain_output.getvalue()
 
 
-def test_validate_vault_path_nonexistent(tmp_path, capsys):
+def test_validate_vault_path_nonexistent(tmp_path, plain_output):
     """Test validation of a nonexistent path."""
     missing = tmp_path / "does-not-exist"
     ok = validate_vault_path(missing)
-    assert ok is False
-    captured = capsys.readouterr()
-    assert "does not exist" in captured.out
+    assert ok is None
+    assert "does not exist" in plain_output.getvalue()
 
 
-def test_validate_vault_path_file_instead_of_dir(tmp_path, capsys):
+def test_validate_vault_path_file_instead_of_dir(tmp_path, plain_output):
     """Test validation when path points to a file instead of directory."""
     f = tmp_path / "file.txt"
     f.write_text("hi")
     ok = validate_vault_path(f)
-    assert ok is False
-    captured = capsys.readouterr()
-    assert "is not a directory" in captured.out
+    assert ok is None
+    assert "is not a directory" in plain_output.getvalue()
 
 
-def test_validate_vault_path_permission_error_simulated(tmp_path, capsys, monkeypatch):
-    """Simulate PermissionError on iterdir in a cross-platform safe way."""
-    real_iterdir = Path.iterdir
+def test_validate_vault_path_permission_error_simulated(tmp_path, plain_output, monkeypatch):
+    """Simulate PermissionError on scandir in a cross-platform safe way."""
+    real_scandir = os.scandir
+    # validate_vault_path probes the resolved path, so compare strings once
+    # instead of resolving every path scandir() sees during the test
+    target = str(tmp_path.resolve())
 
-    def guarded_iterdir(self):
-        if self.resolve() == tmp_path.resolve():
+    def guarded_scandir(path="."):
+        if os.fspath(path) == target:
             raise PermissionError("simulated permission denied")
-        return real_iterdir(self)
+        return real_scandir(path)
 
-    monkeypatch.setattr(Path, "iterdir", guarded_iterdir)
+    monkeypatch.setattr(os, "scandir", guarded_scandir)
     ok = validate_vault_path(tmp_path)
-    assert ok is False
-    captured = capsys.readouterr()
-    assert "not readable" in captured.out
+    assert ok is None
+    assert "not readable" in plain_output.getvalue()
 
 
-def test_validate_vault_path_warns_when_os_access_fails(tmp_path, capsys, monkeypatch):
+def test_validate_vault_path_warns_when_os_access_fails(tmp_path, plain_output, monkeypatch):
     """Test warning when os.access reports limited permissions."""
     monkeypatch.setattr(os, "access", lambda *_args, **_kw: False)
     ok = validate_vault_path(tmp_path)
-    assert ok is True
-    captured = capsys.readouterr()
-    assert "may not be fully accessible" in captured.out
+    assert ok is not None
+    assert "may not be fully accessible" in plain_output.getvalue()
 
 
-def test_validate_vault_path_with_traversal(tmp_path, capsys):
+def test_validate_vault_path_with_traversal(tmp_path, plain_output):
     """Test that path traversal to existing directories works correctly.
 
     Note: This function no longer prevents path traversal - it simply validates
@@ -123,37 +148,35 @@ def test_validate_vault_path_with_traversal(tmp_path, capsys):
 
     # This should succeed because it resolves to the parent directory which exists
     ok = validate_vault_path(traversal_to_parent)
-    assert ok is True  # Parent directory should exist and be accessible
+    assert ok is not None  # Parent directory should exist and be accessible
 
     # Test 2: Create a non-existent traversal path
     nonexistent_traversal = tmp_path / ".." / "nonexistent_directory_12345"
     ok_nonexistent = validate_vault_path(nonexistent_traversal)
-    assert ok_nonexistent is False
-    captured = capsys.readouterr()
-    assert "does not exist" in captured.out
+    assert ok_nonexistent is None
+    assert "does not exist" in plain_output.getvalue()
 
 
-def test_validate_vault_path_unicode(tmp_path, capsys):
+def test_validate_vault_path_unicode(tmp_path):
     """Test Unicode path handling."""
     unicode_path = tmp_path / "测试"
     unicode_path.mkdir()
     ok = validate_vault_path(unicode_path)
-    assert ok is True
+    assert ok is not None
 
 
-def test_validate_vault_path_long_path(tmp_path, capsys):
+@pytest.mark.skipif(os.name != "nt", reason="Windows-only path length check")
+def test_validate_vault_path_long_path(tmp_path, plain_output):
     """Test handling of excessively long paths."""
-    if os.name == "nt":  # Windows specific test
-        very_long = tmp_path / (
-            "x" * (WINDOWS_MAX_SAFE_PATH_LENGTH + 10)
-        )  # Exceed safe limit by 10 chars
-        ok = validate_vault_path(very_long)
-        assert ok is False
-        captured = capsys.readouterr()
-        assert "maximum safe length" in captured.out.lower()
+    very_long = tmp_path / (
+        "x" * (WINDOWS_MAX_SAFE_PATH_LENGTH + 10)
+    )  # Exceed safe limit by 10 chars
+    ok = validate_vault_path(very_long)
+    assert ok is None
+    assert "maximum safe length" in plain_output.getvalue().lower()
 
 
-def test_validate_vault_path_symlink(tmp_path, capsys):
+def test_validate_vault_path_symlink(tmp_path):
     """Test strict symlink resolution."""
     target = tmp_path / "target"
     target.mkdir()
@@ -165,7 +188,7 @@ def test_validate_vault_path_symlink(tmp_path, capsys):
 
     ok = validate_vault_path(symlink)
     # Should succeed since it's a valid symlink
-    assert ok is True
+    assert ok is not None
 
 
 def test_path_traversal_behavior_documentation(tmp_path):
@@ -179,8 +202,6 @@ def test_path_traversal_behavior_documentation(tmp_path):
     If someone tries to add path traversal validation in the future,
     this test will help ensure it's implemented correctly.
     """
-    from vaultlint.cli import validate_vault_path
-
     # Create a test scenario
     subdir = tmp_path / "subdir"
     subdir.mkdir()
@@ -190,7 +211,7 @@ def test_path_traversal_behavior_documentation(tmp_path):
 
     # This should succeed because it resolves to an existing directory
     result = validate_vault_path(traversal_path)
-    assert result is True  # Should pass validation
+    assert result is not None  # Should pass validation
 
     # Verify it actually resolves to the same directory
     assert traversal_path.resolve() == subdir.resolve()
@@ -198,4 +219,4 @@ def test_path_traversal_behavior_documentation(tmp_path):
     # A path that traverses to non-existent location should fail
     bad_traversal = subdir / ".." / "nonexistent"
     result_bad = validate_vault_path(bad_traversal)
-    assert result_bad is False  # Should fail because directory doesn't exist
+    assert result_bad is None  # Should fail because directory doesn't exist
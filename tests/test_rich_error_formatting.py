@@ -10,21 +10,36 @@ from vaultlint.cli import RichArgumentParser
 from vaultlint.output import output, OutputManager
 
 
+class RecordingOutputManager:
+    """Minimal output manager stand-in that records usage errors."""
+
+    def __init__(self):
+        self.usage_errors = []
+
+    def print_usage_error(self, prog: str, message: str):
+        self.usage_errors.append((prog, message))
+
+
+@pytest.fixture
+def rich_parser():
+    """Return a RichArgumentParser with a single required 'path' argument."""
+    parser = RichArgumentParser(prog="vaultlint", output_manager=OutputManager())
+    parser.add_argument("path", help="Path to vault")
+    return parser
+
+
 class TestRichArgumentParser:
     """Tests for the RichArgumentParser class that provides rich-formatted error messages."""
 
-    def test_missing_required_argument_formatting(self):
+    def test_missing_required_argument_formatting(self, rich_parser):
         """Test rich formatting when required arguments are missing.
 
         Ensures that missing argument errors use consistent rich formatting
         with the rest of the application (red error icon, clear message).
         """
-        parser = RichArgumentParser(prog="vaultlint", output_manager=OutputManager())
-        parser.add_argument("path", help="Path to vault")
-
         with patch("vaultlint.output.console") as mock_console:
             with pytest.raises(SystemExit) as exc_info:
-                parser.parse_args([])
+                rich_parser.parse_args([])
 
             # Verify correct exit code (standard argparse behavior)
             assert exc_info.value.code == 2
@@ -41,18 +56,15 @@ class TestRichArgumentParser:
             assert "Missing required argument 'path'" in str(error_call)
             assert "[bold magenta]vaultlint --help[/bold magenta]" in str(help_call)
 
-    def test_unrecognized_argument_formatting(self):
+    def test_unrecognized_argument_formatting(self, rich_parser):
         """Test rich formatting when unrecognized arguments are provided.
 
         Ensures that invalid argument errors use consistent rich formatting
         and provide clear feedback about what went wrong.
         """
-        parser = RichArgumentParser(prog="vaultlint", output_manager=OutputManager())
-        parser.add_argument("path", help="Path to vault")
-
         with patch("vaultlint.output.console") as mock_console:
             with pytest.raises(SystemExit) as exc_info:
-                parser.parse_args(["somepath", "--nonexistent-flag"])
+                rich_parser.parse_args(["somepath", "--nonexistent-flag"])
 
             # Verify correct exit code
             assert exc_info.value.code == 2
@@ -68,17 +80,14 @@ class TestRichArgumentParser:
             assert "Unrecognized argument: --nonexistent-flag" in str(error_call)
             assert "[bold magenta]vaultlint --help[/bold magenta]" in str(help_call)
 
-    def test_multiple_unrecognized_arguments_formatting(self):
+    def test_multiple_unrecognized_arguments_formatting(self, rich_parser):
         """Test rich formatting when multiple unrecognized arguments are provided.
 
         Ensures proper handling and formatting when users provide multiple invalid flags.
         """
-        parser = RichArgumentParser(prog="testprog", output_manager=OutputManager())
-        parser.add_argument("path", help="Path to vault")
-
         with patch("vaultlint.output.console") as mock_console:
             with pytest.raises(SystemExit) as exc_info:
-                parser.parse_args(["somepath", "-x", "-y", "--invalid"])
+                rich_parser.parse_args(["somepath", "-x", "-y", "--invalid"])
 
             assert exc_info.value.code == 2
             assert mock_console.print.call_count == 2
@@ -88,6 +97,57 @@ class TestRichArgumentParser:
             assert "[red]✗ Error:[/red]" in str(error_call)
             assert "Unrecognized argument:" in str(error_call)
 
+    @pytest.mark.parametrize(
+        "message, friendly_message",
+        [
+            (
+                "the following arguments are required: path",
+                "Missing required argument 'path'",
+            ),
+            (
+                "the following arguments are required: -s/--spec",
+                "Missing required argument: -s/--spec",
+            ),
+            (
+                "unrecognized arguments: --invalid-flag",
+                "Unrecognized argument: --invalid-flag",
+            ),
+            ("some generic error message", "Some generic error message"),
+        ],
+    )
+    def test_error_message_translation(self, message, friendly_message):
+        """Test each argparse error branch exits with code 2 and a friendly message.
+
+        Uses a recording output manager, so no Rich rendering or stdout
+        capture is involved; the formatting itself is covered above.
+        """
+        recorder = RecordingOutputManager()
+        parser = RichArgumentParser(prog="vaultlint", output_manager=recorder)
+
+        with pytest.raises(SystemExit) as exc_info:
+            parser.error(message)
+
+        assert exc_info.value.code == 2
+        assert recorder.usage_errors == [("vaultlint", friendly_message)]
+
+    def test_default_output_manager_is_resolved_lazily(self):
+        """Test that a parser built without an output manager uses the shared one.
+
+        parse_arguments() relies on this so Rich is only imported on errors.
+        """
+        parser = RichArgumentParser(prog="vaultlint")
+        parser.add_argument("path", help="Path to vault")
+
+        with patch("vaultlint.output.console") as mock_console:
+            with pytest.raises(SystemExit) as exc_info:
+                parser.parse_args([])
+
+            assert exc_info.value.code == 2
+            assert mock_console.print.call_count == 2
+            assert "Missing required argument 'path'" in str(
+                mock_console.print.call_args_list[0]
+            )
+
 
 class TestOutputUsageErrorMethod:
     """Tests for the output module's print_usage_error method."""
@@ -124,3 +184,53 @@ class TestOutputUsageErrorMethod:
             assert "[bold magenta]different-tool --help[/bold magenta]" in str(
                 help_call
             )
+
+
+class TestOutputBatching:
+    """Tests for OutputManager.batch() message coalescing."""
+
+    def test_batch_flushes_messages_in_one_print(self):
+        """Test that messages inside batch() are written with a single print call."""
+        manager = OutputManager()
+
+        with patch("vaultlint.output.console") as mock_console:
+            with manager.batch():
+                manager.print_checking_vault("/vault")
+                manager.print_warning("Careful", "/vault/x")
+                manager.print_no_spec()
+                assert mock_console.print.call_count == 0
+
+            assert mock_console.print.call_count == 1
+            printed = mock_console.print.call_args_list[0].args[0]
+            assert printed.plain.splitlines() == [
+                "Checking vault: /vault",
+                "⚠ Careful '/vault/x'",
+                "Using default checks (no specification file)",
+            ]
+
+    def test_batch_flushes_on_exception(self):
+        """Test that queued messages are still printed when the block raises."""
+        manager = OutputManager()
+
+        with patch("vaultlint.output.console") as mock_console:
+            with pytest.raises(RuntimeError):
+                with manager.batch():
+                    manager.print_error("Something broke")
+                    raise RuntimeError
+
+            assert mock_console.print.call_count == 1
+
+        # Outside the batch, messages are printed immediately again
+        with patch("vaultlint.output.console") as mock_console:
+            manager.print_success("Done")
+            assert mock_console.print.call_count == 1
+
+
+class TestOutputMessageText:
+    """Tests for the prebuilt Text messages used by OutputManager."""
+
+    def test_square_brackets_in_paths_are_printed_literally(self, plain_output):
+        """Test that paths are not interpreted as Rich markup."""
+        OutputManager().print_error("The path does not exist", "notes/[bold]x")
+
+        assert "✗ The path does not exist 'notes/[bold]x'" in plain_output.getvalue()
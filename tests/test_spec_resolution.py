@@ -20,7 +20,7 @@ def test_resolve_spec_file_explicit_exists(tmp_path):
     assert result == spec_file.resolve()
 
 
-def test_resolve_spec_file_explicit_missing(tmp_path, capsys):
+def test_resolve_spec_file_explicit_missing(tmp_path, plain_output):
     """Test resolve_spec_file with explicit spec that doesn't exist shows warning."""
     vault_path = tmp_path / "vault"
     vault_path.mkdir()
@@ -30,8 +30,7 @@ def test_resolve_spec_file_explicit_missing(tmp_path, capsys):
     assert result is None
     
     # Check Rich output shows warning (not error) - linter behavior
-    captured = capsys.readouterr()
-    assert "Specification file not found" in captured.out
+    assert "Specification file not found" in plain_output.getvalue()
 
 
 def test_resolve_spec_file_default_in_vault(tmp_path):
@@ -1,25 +1,26 @@
 """Tests for struct_checker functionality."""
 
-import tempfile
+import errno
+import os
 from pathlib import Path
-from contextlib import contextmanager
 from unittest.mock import patch
 
+import pytest
+
 from vaultlint.cli import LintContext
 from vaultlint.checks.structure.struct_checker import struct_checker, load_spec_file
 
 
-@contextmanager
-def temp_yaml_file(content: str):
-    """Context manager for creating temporary YAML files with automatic cleanup."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        f.write(content)
-        temp_path = Path(f.name)
+@pytest.fixture
+def write_spec(tmp_path):
+    """Return a helper that writes YAML content to a spec file under tmp_path."""
 
-    try:
-        yield temp_path
-    finally:
-        temp_path.unlink(missing_ok=True)  # Cleanup even if file doesn't exist
+    def write(content: str) -> Path:
+        spec_path = tmp_path / "spec.yaml"
+        spec_path.write_text(content, encoding="utf-8")
+        return spec_path
+
+    return write
 
 
 # ---------- Core contract behavior ----------
@@ -33,7 +34,7 @@ def test_struct_checker_skips_when_no_spec_provided():
     assert result is True  # Should succeed when no spec is required
 
 
-def test_struct_checker_loads_valid_spec_file():
+def test_struct_checker_loads_valid_spec_file(write_spec):
     """Test struct_checker successfully loads and processes valid YAML spec."""
     yaml_content = """
 version: 0.0.1
@@ -43,11 +44,11 @@ structure:
     name: ".obsidian"
 """
 
-    with temp_yaml_file(yaml_content) as spec_path:
-        context = LintContext(vault_path=Path("/vault"), spec_path=spec_path)
-        result = struct_checker(context)
+    spec_path = write_spec(yaml_content)
+    context = LintContext(vault_path=Path("/vault"), spec_path=spec_path)
+    result = struct_checker(context)
 
-        assert result is True  # Should succeed when spec loads
+    assert result is True  # Should succeed when spec loads
 
 
 def test_struct_checker_handles_missing_spec_file():
@@ -60,91 +61,100 @@ def test_struct_checker_handles_missing_spec_file():
     assert result is False  # Should fail when spec file is missing
 
 
-def test_struct_checker_handles_invalid_yaml():
+def test_struct_checker_handles_invalid_yaml(write_spec):
     """Test struct_checker returns False when spec file contains invalid YAML."""
     invalid_yaml_content = "invalid: yaml: content: [unclosed"  # Invalid YAML
 
-    with temp_yaml_file(invalid_yaml_content) as spec_path:
-        context = LintContext(vault_path=Path("/vault"), spec_path=spec_path)
-        result = struct_checker(context)
+    spec_path = write_spec(invalid_yaml_content)
+    context = LintContext(vault_path=Path("/vault"), spec_path=spec_path)
+    result = struct_checker(context)
+
+    assert result is False  # Should fail when YAML is invalid
+
+
+def test_struct_checker_yaml_error_names_spec_file(write_spec, caplog):
+    """Test the logged YAML error points at the offending spec file."""
+    spec_path = write_spec("version: 1\n  bad: [unclosed")
+    context = LintContext(vault_path=Path("/vault"), spec_path=spec_path)
 
-        assert result is False  # Should fail when YAML is invalid
+    assert struct_checker(context) is False
+    assert str(spec_path) in caplog.text
 
 
 # ---------- load_spec_file utility function tests ----------
 
 
-def test_load_spec_file_success():
+def test_load_spec_file_success(write_spec):
     """Test load_spec_file loads valid YAML correctly."""
     yaml_content = """version: "0.0.1"
 structure:
   - type: dir
     name: .obsidian"""
 
-    with temp_yaml_file(yaml_content) as spec_path:
-        result = load_spec_file(str(spec_path))
+    spec_path = write_spec(yaml_content)
+    result = load_spec_file(spec_path)
 
-        assert isinstance(result, dict)
-        assert result["version"] == "0.0.1"
-        assert "structure" in result
-        assert isinstance(result["structure"], list)
-        assert len(result["structure"]) == 1
-        assert result["structure"][0]["type"] == "dir"
-        assert result["structure"][0]["name"] == ".obsidian"
+    assert isinstance(result, dict)
+    assert result["version"] == "0.0.1"
+    assert "structure" in result
+    assert isinstance(result["structure"], list)
+    assert len(result["structure"]) == 1
+    assert result["structure"][0]["type"] == "dir"
+    assert result["structure"][0]["name"] == ".obsidian"
 
 
 def test_load_spec_file_missing_file():
     """Test load_spec_file raises FileNotFoundError for missing files."""
-    nonexistent_path = "/definitely/does/not/exist.yaml"
+    nonexistent_path = Path("/definitely/does/not/exist.yaml")
 
     try:
         load_spec_file(nonexistent_path)
         assert False, "Should have raised FileNotFoundError"
     except FileNotFoundError as e:
-        assert "File not found" in str(e)
+        assert e.errno == errno.ENOENT
         # Path normalization may change slashes, so just check the filename is there
         assert "exist.yaml" in str(e)
 
 
-def test_load_spec_file_loads_yaml_successfully():
+def test_load_spec_file_loads_yaml_successfully(write_spec):
     """Test load_spec_file successfully loads and returns YAML content."""
     yaml_content = "version: 1.0\nname: test"
 
-    with temp_yaml_file(yaml_content) as spec_path:
-        result = load_spec_file(str(spec_path))
+    spec_path = write_spec(yaml_content)
+    result = load_spec_file(spec_path)
 
-        assert result is not None
-        assert isinstance(result, dict)
-        assert result["version"] == 1.0  # YAML parses 1.0 as float
-        assert result["name"] == "test"
+    assert result is not None
+    assert isinstance(result, dict)
+    assert result["version"] == 1.0  # YAML parses 1.0 as float
+    assert result["name"] == "test"
 
 
 # ---------- Context integration behavior ----------
 
 
-def test_struct_checker_uses_context_spec_path_correctly():
+def test_struct_checker_uses_context_spec_path_correctly(write_spec):
     """Test struct_checker uses the exact spec_path from context."""
     yaml_content = "version: test"
 
-    with temp_yaml_file(yaml_content) as expected_spec_path:
-        # Mock load_spec_file to verify it receives the correct path
-        actual_path_received = None
+    expected_spec_path = write_spec(yaml_content)
+    # Mock load_spec_file to verify it receives the correct path
+    actual_path_received = None
 
-        def mock_load_spec_file(path_str):
-            nonlocal actual_path_received
-            actual_path_received = path_str
-            return {"version": "test"}
+    def mock_load_spec_file(path):
+        nonlocal actual_path_received
+        actual_path_received = path
+        return {"version": "test"}
 
-        with patch(
-            "vaultlint.checks.structure.struct_checker.load_spec_file",
-            mock_load_spec_file,
-        ):
-            context = LintContext(
-                vault_path=Path("/vault"), spec_path=expected_spec_path
-            )
-            struct_checker(context)
+    with patch(
+        "vaultlint.checks.structure.struct_checker.load_spec_file",
+        mock_load_spec_file,
+    ):
+        context = LintContext(
+            vault_path=Path("/vault"), spec_path=expected_spec_path
+        )
+        struct_checker(context)
 
-            assert actual_path_received == str(expected_spec_path)
+        assert actual_path_received == expected_spec_path
 
 
 # ---------- Error resilience ----------
@@ -165,17 +175,67 @@ def test_struct_checker_graceful_degradation_philosophy():
     ), "Missing spec should be treated as success (graceful degradation)"
 
 
-def test_struct_checker_current_placeholder_behavior():
+def test_struct_checker_current_placeholder_behavior(write_spec):
     """Test current placeholder behavior - always returns True for valid specs."""
     # This test documents the current state and will need updating when real logic is implemented
     yaml_content = "version: 1.0\nallow_extra_dirs: false"  # Any valid YAML
 
-    with temp_yaml_file(yaml_content) as spec_path:
-        context = LintContext(vault_path=Path("/vault"), spec_path=spec_path)
-        result = struct_checker(context)
+    spec_path = write_spec(yaml_content)
+    context = LintContext(vault_path=Path("/vault"), spec_path=spec_path)
+    result = struct_checker(context)
+
+    # Current behavior: return True if spec loads (placeholder)
+    # This test will need updating when real validation logic is implemented
+    assert (
+        result is True
+    ), "Current implementation should return True for loadable specs"
+
+
+# ---------- Specification caching ----------
+
+
+def test_load_spec_file_reuses_parsed_spec_when_unchanged(write_spec):
+    """Test load_spec_file serves an unchanged file from the cache."""
+    spec_path = write_spec("version: 1.0")
+    first = load_spec_file(spec_path)
+
+    with patch("vaultlint.checks.structure.struct_checker.yaml.load") as mock:
+        second = load_spec_file(spec_path)
+
+    mock.assert_not_called()
+    assert second == first
+
+
+def test_load_spec_file_returns_independent_copies(write_spec):
+    """Test changes to one loaded spec do not leak into later loads."""
+    spec_path = write_spec("structure:\n  - type: dir\n    name: .obsidian")
+    first = load_spec_file(spec_path)
+    first["structure"].append({"type": "dir", "name": "extra"})
+
+    second = load_spec_file(spec_path)
+
+    assert second == {"structure": [{"type": "dir", "name": ".obsidian"}]}
+
+
+def test_load_spec_file_reloads_after_modification(write_spec):
+    """Test load_spec_file parses the file again once its mtime changes."""
+    spec_path = write_spec("version: 1.0")
+    assert load_spec_file(spec_path)["version"] == 1.0
+
+    spec_path.write_text("version: 2.0", encoding="utf-8")
+    mtime_ns = spec_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(spec_path, ns=(mtime_ns, mtime_ns))
+
+    assert load_spec_file(spec_path)["version"] == 2.0
+
+
+def test_load_spec_file_reloads_when_size_changes_within_same_mtime(write_spec):
+    """Test load_spec_file notices edits that keep the mtime but change the size."""
+    spec_path = write_spec("version: 1.0")
+    mtime_ns = spec_path.stat().st_mtime_ns
+    assert load_spec_file(spec_path)["version"] == 1.0
+
+    spec_path.write_text("version: 12.5", encoding="utf-8")
+    os.utime(spec_path, ns=(mtime_ns, mtime_ns))
 
-        # Current behavior: return True if spec loads (placeholder)
-        # This test will need updating when real validation logic is implemented
-        assert (
-            result is True
-        ), "Current implementation should return True for loadable specs"
+    assert load_spec_file(spec_path)["version"] == 12.5